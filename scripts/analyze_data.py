@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import statistics
+import sys
 
 def percentile(data, p):
     """Calculate the p-th percentile of a list of numbers."""
@@ -15,6 +16,25 @@ turbo_hmr = [28, 41, 26, 26, 25, 25, 26, 26, 26, 27, 27, 26, 26, 25, 26, 25, 26,
 legacy_cold = [1438, 1275, 1265, 1289, 1300, 1242, 1342, 1284, 1237, 1294, 1433, 1266, 1377, 1224, 1279, 1196, 1511, 1234, 1282, 1226, 1268, 1253, 1280, 1290, 1215, 1278, 1208, 1259, 1263, 1251]
 turbo_cold = [622, 567, 564, 570, 563, 566, 566, 565, 566, 563, 567, 604, 567, 566, 565, 567, 564, 571, 565, 568, 569, 566, 567, 564, 569, 565, 565, 565, 566, 566]
 
+# Optional: read the same condition straight from a packed results archive
+# Usage: python scripts/analyze_data.py [results.npz [dataset]]
+if len(sys.argv) > 1:
+    from results_archive import ResultsArchive
+    dataset = sys.argv[2] if len(sys.argv) > 2 else 'final_dataset_n30'
+    try:
+        archive = ResultsArchive(sys.argv[1])
+    except (OSError, ValueError, KeyError) as e:
+        sys.exit(f"Error: cannot read archive {sys.argv[1]}: {e}")
+    with archive:
+        try:
+            legacy_hmr = [int(v) for v in archive.latencies(dataset, 'legacy', 'hmr')]
+            turbo_hmr = [int(v) for v in archive.latencies(dataset, 'turbo', 'hmr')]
+            legacy_cold = [int(v) for v in archive.latencies(dataset, 'legacy', 'coldstart')]
+            turbo_cold = [int(v) for v in archive.latencies(dataset, 'turbo', 'coldstart')]
+        except KeyError as e:
+            datasets = sorted({d for d, _ in archive.conditions})
+            sys.exit(f"Error: {e.args[0]} in {sys.argv[1]} (available datasets: {', '.join(datasets)})")
+
 def calc_stats(data, name):
     mean = statistics.mean(data)
     median = statistics.median(data)
@@ -31,16 +51,29 @@ def calc_stats(data, name):
         'max': max(data)
     }
 
-legacy_hmr_stats = calc_stats(legacy_hmr, "Legacy HMR")
-turbo_hmr_stats = calc_stats(turbo_hmr, "Turbo HMR")
-legacy_cold_stats = calc_stats(legacy_cold, "Legacy Cold Start")
-turbo_cold_stats = calc_stats(turbo_cold, "Turbo Cold Start")
+# Conditions with fewer than 2 successful runs (e.g. no HMR logs in
+# phase1_cold_start) have no standard deviation and are skipped
+conditions = [
+    ('legacy_cold', legacy_cold, "Legacy Cold Start"),
+    ('turbo_cold', turbo_cold, "Turbo Cold Start"),
+    ('legacy_hmr', legacy_hmr, "Legacy HMR"),
+    ('turbo_hmr', turbo_hmr, "Turbo HMR"),
+]
+stats = {key: calc_stats(data, name) for key, data, name in conditions if len(data) >= 2}
+skipped = [name for key, data, name in conditions if key not in stats]
+if not stats:
+    sys.exit("Error: no condition has at least 2 successful runs")
+
+sample_sizes = sorted({s['n'] for s in stats.values()})
+n_label = f"N={sample_sizes[0]}" if len(sample_sizes) == 1 else f"N={sample_sizes[0]}-{sample_sizes[-1]}"
 
 print("=" * 60)
-print("STATISTICAL ANALYSIS RESULTS (N=30)")
+print(f"STATISTICAL ANALYSIS RESULTS ({n_label})")
 print("=" * 60)
+if skipped:
+    print(f"Skipped (fewer than 2 successful runs): {', '.join(skipped)}")
 
-for s in [legacy_cold_stats, turbo_cold_stats, legacy_hmr_stats, turbo_hmr_stats]:
+for s in stats.values():
     print(f"\n{s['name']} (n={s['n']}):")
     print(f"  Mean:   {s['mean']:.2f} ms")
     print(f"  Median: {s['median']:.2f} ms")
@@ -51,15 +84,13 @@ for s in [legacy_cold_stats, turbo_cold_stats, legacy_hmr_stats, turbo_hmr_stats
 print("\n" + "=" * 60)
 print("SPEEDUP FACTORS")
 print("=" * 60)
-cold_speedup = legacy_cold_stats['mean'] / turbo_cold_stats['mean']
-hmr_speedup = legacy_hmr_stats['mean'] / turbo_hmr_stats['mean']
-print(f"Cold Start Speedup: {cold_speedup:.2f}x (Legacy/Turbo)")
-print(f"HMR Speedup: {hmr_speedup:.2f}x (Legacy/Turbo)")
+for label, legacy, turbo in (('Cold Start', 'legacy_cold', 'turbo_cold'), ('HMR', 'legacy_hmr', 'turbo_hmr')):
+    if legacy in stats and turbo in stats:
+        speedup = stats[legacy]['mean'] / stats[turbo]['mean']
+        print(f"{label} Speedup: {speedup:.2f}x (Legacy/Turbo)")
 
 print("\n" + "=" * 60)
 print("COEFFICIENT OF VARIATION (Stability)")
 print("=" * 60)
-print(f"Legacy Cold Start CV: {(legacy_cold_stats['stdev']/legacy_cold_stats['mean'])*100:.2f}%")
-print(f"Turbo Cold Start CV:  {(turbo_cold_stats['stdev']/turbo_cold_stats['mean'])*100:.2f}%")
-print(f"Legacy HMR CV:        {(legacy_hmr_stats['stdev']/legacy_hmr_stats['mean'])*100:.2f}%")
-print(f"Turbo HMR CV:         {(turbo_hmr_stats['stdev']/turbo_hmr_stats['mean'])*100:.2f}%")
+for s in stats.values():
+    print(f"{s['name'] + ' CV:':<22}{(s['stdev']/s['mean'])*100:.2f}%")
@@ -14,6 +14,10 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
 import os
+import sys
+
+from results_archive import ResultsArchive
+from results_io import parse_environment, read_environment
 
 # =============================================================================
 # Configuration
@@ -22,6 +26,12 @@ import os
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'results', 'charts')
 
+# Platform and framework shown in chart footers, taken from the repository's
+# environment.txt (or the archive's environment.txt when charts are built from an archive)
+ENVIRONMENT = parse_environment(read_environment(os.path.join(os.path.dirname(__file__), '..')))
+PLATFORM = ENVIRONMENT['cpu']
+FRAMEWORK = f"Next.js {ENVIRONMENT['nextjs']}"
+
 # Color palette (Vercel-inspired)
 COLORS = {
     'webpack': '#3178C6',      # TypeScript Blue (representing legacy JS tooling)
@@ -49,6 +59,20 @@ DATA = {
     }
 }
 
+# Cold start means from the small project (N=30 per condition)
+COLD_START = {
+    'webpack': 1285.30,
+    'turbopack': 569.27,
+    'n_webpack': 30,
+    'n_turbopack': 30
+}
+
+# Dataset directories backing DATA/COLD_START when charts are built from a packed archive
+ARCHIVE_DATASETS = {
+    'small': 'final_dataset_n30',
+    'medium': 'medium_project_n30'
+}
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -58,6 +82,47 @@ def setup_output_directory():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     print(f"📁 Output directory: {os.path.abspath(OUTPUT_DIR)}")
 
+def load_archive_data(path):
+    """
+    Recompute DATA and COLD_START (mean latency and N per condition) from a
+    packed results archive, and take PLATFORM and FRAMEWORK from its
+    environment.txt if it has one.
+    """
+    global PLATFORM, FRAMEWORK
+    with ResultsArchive(path) as archive:
+        for bundler, mode in (('webpack', 'legacy'), ('turbopack', 'turbo')):
+            for size, dataset in ARCHIVE_DATASETS.items():
+                hmr = archive.latencies(dataset, mode, 'hmr')
+                DATA[size][bundler] = round(float(hmr.mean()), 2)
+                DATA[size][f'n_{bundler}'] = int(hmr.size)
+            cold = archive.latencies(ARCHIVE_DATASETS['small'], mode, 'coldstart')
+            COLD_START[bundler] = round(float(cold.mean()), 2)
+            COLD_START[f'n_{bundler}'] = int(cold.size)
+
+        environment = archive.read_environment()
+        if environment:
+            fingerprint = parse_environment(environment)
+            PLATFORM = fingerprint['cpu']
+            FRAMEWORK = f"Next.js {fingerprint['nextjs']}"
+    print(f"📦 Data loaded from archive: {path}")
+
+def sample_size_note():
+    """
+    Return (sample size line, footnote) for the summary panel. N is the
+    largest per-condition count; conditions with fewer successful runs
+    are reported as failures.
+    """
+    counts = [(bundler, source[f'n_{bundler}'])
+              for source in (DATA['small'], DATA['medium'], COLD_START)
+              for bundler in ('webpack', 'turbopack')]
+    n = max(count for _, count in counts)
+    short = [(bundler, count) for bundler, count in counts if count < n]
+    if not short:
+        return f'Sample Size: N={n}', ''
+    failed = sum(n - count for _, count in short)
+    bundlers = '/'.join(sorted({bundler.capitalize() for bundler, _ in short}, reverse=True))
+    return f'Sample Size: N={n} (N={min(count for _, count in short)}*)', f'* {failed} {bundlers} runs failed'
+
 def apply_professional_style(ax, title, xlabel, ylabel):
     """Apply consistent professional styling to axes."""
     ax.set_title(title, fontsize=14, fontweight='bold', color=COLORS['text'], pad=20)
@@ -183,7 +248,7 @@ def generate_bar_chart():
     # Add methodology note
     fig.text(
         0.5, 0.02,
-        'Data: N=30 samples per condition | Platform: Apple M1 | Framework: Next.js 14',
+        f'Data: N={max(DATA["small"]["n_webpack"], DATA["small"]["n_turbopack"])} samples per condition | Platform: {PLATFORM} | Framework: {FRAMEWORK}',
         ha='center',
         fontsize=9,
         color=COLORS['annotation'],
@@ -408,9 +473,16 @@ def generate_scalability_chart():
     legend.get_frame().set_linewidth(1.5)
     
     # Add methodology note
+    sample_sizes = []
+    for label, size in (('Small', 'small'), ('Medium', 'medium')):
+        n_webpack, n_turbopack = DATA[size]['n_webpack'], DATA[size]['n_turbopack']
+        if n_webpack == n_turbopack:
+            sample_sizes.append(f'{label}: N={n_webpack}')
+        else:
+            sample_sizes.append(f'{label}: Webpack N={n_webpack}, Turbopack N={n_turbopack}')
     fig.text(
         0.5, 0.02,
-        'All data points are empirically measured | Small: N=30 | Medium: Webpack N=28, Turbopack N=30',
+        'All data points are empirically measured | ' + ' | '.join(sample_sizes),
         ha='center',
         fontsize=9,
         color=COLORS['annotation'],
@@ -441,9 +513,11 @@ def generate_summary_chart():
     # --- Panel 1: Cold Start Comparison ---
     ax1 = axes[0]
     cold_start_data = {
-        'Webpack': 1285.30,
-        'Turbopack': 569.27
+        'Webpack': COLD_START['webpack'],
+        'Turbopack': COLD_START['turbopack']
     }
+    cold_speedup = COLD_START['webpack'] / COLD_START['turbopack']
+    cold_xlim = max(cold_start_data.values()) * 1.25
     
     bars = ax1.barh(
         list(cold_start_data.keys()),
@@ -456,21 +530,21 @@ def generate_summary_chart():
     
     for bar, val in zip(bars, cold_start_data.values()):
         ax1.text(
-            val + 30, bar.get_y() + bar.get_height()/2,
+            val + cold_xlim * 0.02, bar.get_y() + bar.get_height()/2,
             f'{val:.0f} ms',
             va='center',
             fontsize=11,
             fontweight='bold'
         )
     
-    ax1.set_xlim(0, 1600)
+    ax1.set_xlim(0, cold_xlim)
     ax1.set_title('Cold Start Time', fontsize=12, fontweight='bold', pad=15)
     ax1.set_xlabel('Time (ms)', fontsize=10)
     
     # Speedup badge
     ax1.text(
-        800, -0.5,
-        '2.26× faster',
+        cold_xlim / 2, -0.5,
+        f'{cold_speedup:.2f}× faster',
         fontsize=10,
         fontweight='bold',
         color=COLORS['turbopack'],
@@ -480,9 +554,12 @@ def generate_summary_chart():
     # --- Panel 2: HMR Speedup Factor (Measured Only) ---
     ax2 = axes[1]
     
+    small_speedup = DATA['small']['webpack'] / DATA['small']['turbopack']
+    medium_speedup = DATA['medium']['webpack'] / DATA['medium']['turbopack']
+    speedup_growth = (medium_speedup / small_speedup - 1) * 100
     speedup_data = {
-        'Small\n(~10 comp)': 6.18,
-        'Medium\n(50 comp)': 8.53
+        'Small\n(~10 comp)': small_speedup,
+        'Medium\n(50 comp)': medium_speedup
     }
     
     bars = ax2.bar(
@@ -507,15 +584,15 @@ def generate_summary_chart():
     
     # Add growth annotation
     ax2.annotate(
-        '+38% speedup\nincrease',
-        xy=(0.5, 7.5),
+        f'{speedup_growth:+.0f}% speedup\nincrease',
+        xy=(0.5, max(speedup_data.values()) * 0.88),
         fontsize=9,
         ha='center',
         color=COLORS['annotation'],
         style='italic'
     )
     
-    ax2.set_ylim(0, 12)
+    ax2.set_ylim(0, max(speedup_data.values()) * 1.4)
     ax2.set_title('Turbopack Speedup Factor\n(Measured)', fontsize=12, fontweight='bold', pad=15)
     ax2.set_ylabel('Speedup (×)', fontsize=10)
     
@@ -523,29 +600,30 @@ def generate_summary_chart():
     ax3 = axes[2]
     ax3.axis('off')
     
-    summary_text = """
+    sample_size, sample_footnote = sample_size_note()
+    summary_text = f"""
     KEY FINDINGS
     ════════════════════════
     
     🚀 Cold Start
-       2.26× faster
+       {cold_speedup:.2f}× faster
        
     ⚡ HMR (Small Project)
-       6.18× faster
+       {small_speedup:.2f}× faster
        
     📈 HMR (Medium Project)
-       8.53× faster
+       {medium_speedup:.2f}× faster
        
     📊 Speedup Growth
-       +38% (Small → Medium)
+       {speedup_growth:+.0f}% (Small → Medium)
        
     ════════════════════════
     
-    Platform: Apple M1
-    Framework: Next.js 14
-    Sample Size: N=30 (N=28*)
+    Platform: {PLATFORM}
+    Framework: {FRAMEWORK}
+    {sample_size}
     
-    * 2 Webpack runs failed
+    {sample_footnote}
     """
     
     ax3.text(
@@ -597,13 +675,15 @@ def generate_summary_chart():
 # =============================================================================
 
 def main():
-    """Generate all benchmark visualization charts."""
+    """Generate all benchmark visualization charts (optionally from a packed archive given as argv[1])."""
     print("=" * 60)
     print("  NEXT.JS TOOLCHAIN BENCHMARK - CHART GENERATOR")
     print("=" * 60)
     
     # Setup
     setup_output_directory()
+    if len(sys.argv) > 1:
+        load_archive_data(sys.argv[1])
     
     # Generate charts
     charts = []
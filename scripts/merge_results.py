@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Next.js Toolchain Benchmark - Multi-Machine Result Merger
+=========================================================
+
+Merges result bundles collected on many machines into one dataset indexed
+by environment fingerprint (CPU, RAM, OS, Node, Next.js), then computes
+per-hardware-class statistics and Legacy/Turbo speedups.
+
+Each bundle is a directory or zip laid out like this repository (see
+results_io.py). Bundles are read in a single pass: telemetry CSVs are
+reduced to per-run summaries as they are streamed, so memory grows with
+the number of runs, not with the size of the raw files.
+
+Usage:
+    python scripts/merge_results.py machines/*.zip [--out results/merged]
+
+Outputs (in --out):
+    machines.csv     one row per bundle with its fingerprint
+    runs.csv         one row per run and metric
+    stats.csv        descriptive statistics per group/dataset/metric/mode
+    speedups.csv     Legacy/Turbo speedup per group/dataset/metric
+
+Author: Benchmark Automation Suite
+Date: January 2026
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from results_io import (
+    FINGERPRINT_FIELDS,
+    fingerprint_id,
+    hardware_class,
+    iter_run_files,
+    parse_environment,
+    parse_latency,
+    read_environment,
+    summarize_telemetry,
+)
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'results', 'merged')
+
+LATENCY_METRICS = ('coldstart_ms', 'hmr_ms')
+
+RUN_COLUMNS = ('machine', 'fingerprint', 'hardware_class', 'dataset', 'mode', 'run', 'metric', 'value', 'failed')
+
+GROUP_KEYS = {
+    'hardware': 'hardware_class',
+    'fingerprint': 'fingerprint',
+}
+
+# =============================================================================
+# Ingestion
+# =============================================================================
+
+def machine_name(bundle):
+    """Bundle label used in the outputs (file or directory name without .zip)."""
+    name = os.path.basename(os.path.abspath(bundle))
+    return name[:-4] if name.endswith('.zip') else name
+
+def read_bundle(bundle):
+    """
+    Parse one bundle into its fingerprint and a dict of per-run records
+    keyed by (dataset, mode, run), where ``dataset`` is the run files'
+    directory relative to the bundle root.
+    """
+    fingerprint = parse_environment(read_environment(bundle))
+    records = {}
+    for dataset, mode, run, kind, read in iter_run_files(bundle):
+        record = records.setdefault((dataset, mode, run), {})
+        text = read()
+        if kind == 'system':
+            samples, peak_cpu, peak_mem, _ = summarize_telemetry(text)
+            if samples:
+                record['peak_cpu_percent'] = peak_cpu
+                record['peak_memory_mb'] = peak_mem
+        else:
+            record[f'{kind}_ms'] = parse_latency(text, kind)
+    return fingerprint, records
+
+def merge_bundles(bundles, allow_unknown=False):
+    """
+    Read every bundle once and return (machines, runs) DataFrames.
+
+    ``runs`` is long-form: one row per (machine, dataset, mode, run, metric)
+    with ``value`` NaN and ``failed`` True when a log has no latency line.
+
+    Raises ValueError when a bundle's fingerprint has 'unknown' fields
+    (e.g. no environment.txt), unless ``allow_unknown`` is set, in which
+    case a warning is printed to stderr instead.
+    """
+    machines = []
+    columns = {c: [] for c in RUN_COLUMNS}
+    seen = set()
+
+    for bundle in bundles:
+        base = name = machine_name(bundle)
+        suffix = 1
+        while name in seen:
+            suffix += 1
+            name = f"{base}-{suffix}"
+        seen.add(name)
+
+        fingerprint, records = read_bundle(bundle)
+        unknown = [f for f in FINGERPRINT_FIELDS if fingerprint[f] == 'unknown']
+        if unknown:
+            message = f"{bundle}: unknown fingerprint field(s) {', '.join(unknown)} (missing or incomplete environment.txt)"
+            if not allow_unknown:
+                raise ValueError(f"{message}; pass --allow-unknown to merge it anyway")
+            print(f"⚠️  Warning: {message}", file=sys.stderr)
+        fp_id = fingerprint_id(fingerprint)
+        hw_class = hardware_class(fingerprint)
+        machines.append({'machine': name, 'fingerprint': fp_id, 'hardware_class': hw_class, **fingerprint})
+
+        for (dataset, mode, run), record in records.items():
+            for metric, value in record.items():
+                columns['machine'].append(name)
+                columns['fingerprint'].append(fp_id)
+                columns['hardware_class'].append(hw_class)
+                columns['dataset'].append(dataset)
+                columns['mode'].append(mode)
+                columns['run'].append(run)
+                columns['metric'].append(metric)
+                columns['value'].append(np.nan if value is None else value)
+                columns['failed'].append(value is None)
+        print(f"   • {name}: {len(records)} runs [{hw_class}]")
+
+    machines = pd.DataFrame(machines, columns=['machine', 'fingerprint', 'hardware_class', *FINGERPRINT_FIELDS])
+    runs = pd.DataFrame(columns)
+    for col in ('machine', 'fingerprint', 'hardware_class', 'dataset', 'mode', 'metric'):
+        runs[col] = runs[col].astype('category')
+    runs['run'] = runs['run'].astype(np.int32)
+    runs['value'] = runs['value'].astype(np.float64)
+    runs['failed'] = runs['failed'].astype(bool)
+    return machines, runs
+
+# =============================================================================
+# Statistics
+# =============================================================================
+
+def compute_stats(runs, group_key):
+    """Descriptive statistics per (group, dataset, metric, mode), same measures as analyze_data.py."""
+    keys = [group_key, 'dataset', 'metric', 'mode']
+    grouped = runs.groupby(keys, observed=True)
+    values = grouped['value']
+
+    stats = values.agg(['count', 'mean', 'median', 'std', 'min', 'max'])
+    stats = stats.rename(columns={'count': 'n', 'std': 'stdev'})
+    stats['p95'] = values.quantile(0.95)
+    stats['cv_percent'] = stats['stdev'] / stats['mean'] * 100
+    stats['failed'] = grouped['failed'].sum()
+    stats['machines'] = grouped['machine'].nunique()
+    return stats[['n', 'failed', 'machines', 'mean', 'median', 'stdev', 'p95', 'min', 'max', 'cv_percent']]
+
+def compute_speedups(stats):
+    """Legacy/Turbo speedup factor of the mean, per (group, dataset, latency metric)."""
+    means = stats['mean'].unstack('mode')
+    if not {'legacy', 'turbo'} <= set(means.columns):
+        return pd.DataFrame(columns=['legacy_mean', 'turbo_mean', 'speedup'])
+    means = means[means.index.get_level_values('metric').isin(LATENCY_METRICS)]
+    speedups = pd.DataFrame({
+        'legacy_mean': means['legacy'],
+        'turbo_mean': means['turbo'],
+    })
+    speedups['speedup'] = speedups['legacy_mean'] / speedups['turbo_mean']
+    return speedups.dropna()
+
+# =============================================================================
+# Main Execution
+# =============================================================================
+
+def print_report(machines, stats, speedups, group_key):
+    print("\n" + "=" * 60)
+    print("FINGERPRINT INDEX")
+    print("=" * 60)
+    for fp_id, group in machines.groupby('fingerprint', sort=True):
+        env = group.iloc[0]
+        print(f"\n{fp_id} ({len(group)} machine(s)):")
+        for field in FINGERPRINT_FIELDS:
+            print(f"  {field:<7} {env[field]}")
+
+    print("\n" + "=" * 60)
+    print(f"STATISTICS BY {group_key.upper()}")
+    print("=" * 60)
+    for (group, dataset, metric, mode), s in stats.iterrows():
+        print(f"\n[{group}] {dataset} {metric} {mode} (n={s['n']:.0f}, failed={s['failed']:.0f}, machines={s['machines']:.0f}):")
+        print(f"  Mean:   {s['mean']:.2f}")
+        print(f"  Median: {s['median']:.2f}")
+        print(f"  Std Dev:{s['stdev']:.2f}")
+        print(f"  P95:    {s['p95']:.2f}")
+
+    print("\n" + "=" * 60)
+    print("SPEEDUP FACTORS (Legacy/Turbo)")
+    print("=" * 60)
+    for (group, dataset, metric), s in speedups.iterrows():
+        print(f"[{group}] {dataset} {metric}: {s['speedup']:.2f}x")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('bundles', nargs='+', help='Result bundle directories or .zip files')
+    parser.add_argument('--out', default=OUTPUT_DIR, help='Output directory for merged CSVs')
+    parser.add_argument('--group-by', choices=sorted(GROUP_KEYS), default='hardware',
+                        help='Aggregate per hardware class (CPU + RAM) or per full fingerprint')
+    parser.add_argument('--allow-unknown', action='store_true',
+                        help="Merge bundles whose fingerprint has 'unknown' fields (warn instead of failing)")
+    args = parser.parse_args(argv)
+
+    missing = [b for b in args.bundles if not os.path.exists(b)]
+    if missing:
+        parser.error(f"bundle not found: {', '.join(missing)}")
+
+    paths = [os.path.realpath(b) for b in args.bundles]
+    duplicates = sorted({b for b, p in zip(args.bundles, paths) if paths.count(p) > 1})
+    if duplicates:
+        parser.error(f"bundle given more than once: {', '.join(duplicates)}")
+
+    print(f"📥 Merging {len(args.bundles)} bundle(s)...")
+    try:
+        machines, runs = merge_bundles(args.bundles, allow_unknown=args.allow_unknown)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    if runs.empty:
+        print("No run files found.", file=sys.stderr)
+        return 1
+
+    group_key = GROUP_KEYS[args.group_by]
+    stats = compute_stats(runs, group_key)
+    speedups = compute_speedups(stats)
+
+    os.makedirs(args.out, exist_ok=True)
+    machines.to_csv(os.path.join(args.out, 'machines.csv'), index=False)
+    runs.to_csv(os.path.join(args.out, 'runs.csv'), index=False)
+    stats.to_csv(os.path.join(args.out, 'stats.csv'), float_format='%.2f')
+    speedups.to_csv(os.path.join(args.out, 'speedups.csv'), float_format='%.2f')
+
+    print_report(machines, stats, speedups, group_key)
+    print(f"\n📁 Output location: {os.path.abspath(args.out)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
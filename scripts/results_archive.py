@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Next.js Toolchain Benchmark - Compact Results Archive
+=====================================================
+
+Packs a results directory (or zip) into a single compressed columnar
+archive, and unpacks it back to the original layout byte for byte.
+
+The archive is a regular ``.npz`` (deflate-compressed zip of ``.npy``
+arrays) chunked per condition, i.e. per (dataset directory, mode).
+Each chunk holds:
+
+    run                        run numbers (int32)
+    {coldstart,hmr}_ms         latency per run, NaN if failed or missing
+    {coldstart,hmr}_failed     log present but no latency line
+    {coldstart,hmr,system}_present
+    telemetry_offsets          per-run slice into timestamp/cpu_percent/memory_mb
+    timestamp, cpu_percent, memory_mb
+    {coldstart,hmr}_log(_offsets)   raw log bytes, for lossless unpacking
+    system_raw(_offsets), system_raw_mask
+                               raw CSV bytes, only for runs whose text is not
+                               reproduced exactly from the telemetry columns
+
+Any other file (SUMMARY.txt, charts, environment.txt) is stored verbatim
+under ``files/``. ``manifest.json`` maps conditions to chunk prefixes.
+Members are read on demand, so loading one condition does not touch the rest.
+Empty directories are not recorded.
+
+Usage:
+    python scripts/results_archive.py pack results/ results.npz
+    python scripts/results_archive.py unpack results.npz restored_results/
+
+Author: Benchmark Automation Suite
+Date: January 2026
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import zipfile
+
+import numpy as np
+
+from results_io import LATENCY_PATTERNS, iter_bundle_files, match_run_file, run_file_name
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+FORMAT_VERSION = 1
+
+MANIFEST = 'manifest.json'
+
+FILES_PREFIX = 'files/'
+
+LOG_KINDS = tuple(LATENCY_PATTERNS)
+
+TELEMETRY_HEADER = b'timestamp,cpu_percent,memory_mb\n'
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+def parse_telemetry(data):
+    """Parse *_system.csv bytes into (timestamp, cpu_percent, memory_mb) lists, skipping bad rows."""
+    timestamps, cpu, memory = [], [], []
+    for line in data.decode('utf-8', errors='replace').splitlines()[1:]:
+        fields = line.split(',')
+        try:
+            ts, c, m = int(fields[0]), float(fields[1]), int(fields[2])
+        except (IndexError, ValueError):
+            continue
+        timestamps.append(ts)
+        cpu.append(c)
+        memory.append(m)
+    return timestamps, cpu, memory
+
+def render_telemetry(timestamps, cpu, memory):
+    """Render telemetry columns in the exact format written by monitor_system.sh."""
+    rows = ''.join(f"{ts},{c:.1f},{m}\n" for ts, c, m in zip(timestamps, cpu, memory))
+    return TELEMETRY_HEADER + rows.encode('utf-8')
+
+def _blob(chunks):
+    """Concatenate byte strings into (uint8 array, int64 offsets)."""
+    offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(c) for c in chunks])
+    return np.frombuffer(b''.join(chunks), dtype=np.uint8), offsets
+
+def encode_condition(runs):
+    """
+    Build the arrays for one condition from ``{run: {kind: bytes}}``.
+    Returns a dict of array name -> ndarray.
+    """
+    run_ids = sorted(runs)
+    arrays = {'run': np.array(run_ids, dtype=np.int32)}
+
+    for kind in LOG_KINDS:
+        texts = [runs[r].get(kind) for r in run_ids]
+        latencies = []
+        for data in texts:
+            match = data is not None and LATENCY_PATTERNS[kind].search(data.decode('utf-8', errors='replace'))
+            latencies.append(int(match.group(1)) if match else math.nan)
+        present = np.array([t is not None for t in texts], dtype=bool)
+        arrays[f'{kind}_present'] = present
+        arrays[f'{kind}_ms'] = np.array(latencies, dtype=np.float64)
+        arrays[f'{kind}_failed'] = present & np.isnan(arrays[f'{kind}_ms'])
+        arrays[f'{kind}_log'], arrays[f'{kind}_log_offsets'] = _blob([t or b'' for t in texts])
+
+    timestamps, cpu, memory, counts, raw, raw_mask = [], [], [], [], [], []
+    for r in run_ids:
+        data = runs[r].get('system')
+        ts, c, m = parse_telemetry(data) if data is not None else ([], [], [])
+        timestamps.extend(ts)
+        cpu.extend(c)
+        memory.extend(m)
+        counts.append(len(ts))
+        exact = data is None or render_telemetry(ts, c, m) == data
+        raw.append(b'' if exact else data)
+        raw_mask.append(not exact)
+
+    arrays['system_present'] = np.array([runs[r].get('system') is not None for r in run_ids], dtype=bool)
+    arrays['telemetry_offsets'] = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    arrays['timestamp'] = np.array(timestamps, dtype=np.int64)
+    arrays['cpu_percent'] = np.array(cpu, dtype=np.float64)
+    arrays['memory_mb'] = np.array(memory, dtype=np.int32)
+    arrays['system_raw'], arrays['system_raw_offsets'] = _blob(raw)
+    arrays['system_raw_mask'] = np.array(raw_mask, dtype=bool)
+    return arrays
+
+# =============================================================================
+# Pack / Unpack
+# =============================================================================
+
+def pack(source, archive_path):
+    """
+    Pack a results directory or zip into ``archive_path``. Returns the manifest.
+
+    Run files are buffered one directory at a time and each of its
+    conditions is encoded as soon as the directory is finished, so peak
+    memory is bounded by the largest dataset directory, not the whole source.
+
+    Raises ValueError if ``archive_path`` is the source itself. An archive
+    written inside a source directory is skipped rather than packed into itself.
+    """
+    archive_real = os.path.realpath(archive_path)
+    if os.path.realpath(source) == archive_real:
+        raise ValueError(f"archive path is the source itself: {archive_path}")
+    in_directory = os.path.isdir(source)
+
+    manifest = {'version': FORMAT_VERSION, 'conditions': [], 'files': []}
+    with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        current, runs_by_mode = None, {}
+        for relpath, read in iter_bundle_files(source):
+            if in_directory and os.path.realpath(os.path.join(source, relpath)) == archive_real:
+                continue
+            directory, _, name = relpath.rpartition('/')
+            if directory != current:
+                _write_conditions(zf, manifest, current, runs_by_mode)
+                current, runs_by_mode = directory, {}
+
+            match = match_run_file(name)
+            # Only exact run file names are rebuilt on unpack; anything else
+            # (run01_*, hmr.csv, system.log, ...) is kept verbatim
+            if match:
+                mode, run, kind = match
+                runs_by_mode.setdefault(mode, {}).setdefault(run, {})[kind] = read()
+            else:
+                zf.writestr(FILES_PREFIX + relpath, read())
+                manifest['files'].append(relpath)
+        _write_conditions(zf, manifest, current, runs_by_mode)
+
+        zf.writestr(MANIFEST, json.dumps(manifest, indent=2))
+    return manifest
+
+def _write_conditions(zf, manifest, dataset, runs_by_mode):
+    """Encode and write the buffered conditions of one dataset directory."""
+    for mode in sorted(runs_by_mode):
+        prefix = f"c{len(manifest['conditions'])}"
+        runs = runs_by_mode[mode]
+        for name, array in encode_condition(runs).items():
+            with zf.open(f"{prefix}/{name}.npy", 'w', force_zip64=True) as f:
+                np.lib.format.write_array(f, array, allow_pickle=False)
+        manifest['conditions'].append({'dataset': dataset, 'mode': mode, 'prefix': prefix, 'runs': len(runs)})
+
+def unpack(archive_path, destination):
+    """Restore the original directory layout of an archive into ``destination``."""
+    with ResultsArchive(archive_path) as archive:
+        for relpath in archive.manifest['files']:
+            _write(destination, relpath, archive.read_file(relpath))
+
+        for entry in archive.manifest['conditions']:
+            for relpath, data in archive.iter_run_files(entry['dataset'], entry['mode']):
+                _write(destination, relpath, data)
+
+def _write(destination, relpath, data):
+    path = os.path.join(destination, *relpath.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+# =============================================================================
+# Reader
+# =============================================================================
+
+class ResultsArchive:
+    """
+    Random-access reader for an archive written by ``pack``.
+
+    Conditions are addressed by (dataset, mode); ``dataset`` may be the
+    directory path stored in the archive or just its last component
+    (e.g. ``final_dataset_n30``) when that is unambiguous.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._npz = np.load(path, allow_pickle=False)
+        self.manifest = json.loads(self._npz.zip.read(MANIFEST))
+        if self.manifest.get('version') != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported archive version {self.manifest.get('version')}")
+        self._prefixes = {(c['dataset'], c['mode']): c['prefix'] for c in self.manifest['conditions']}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._npz.close()
+
+    @property
+    def conditions(self):
+        """List of (dataset, mode) pairs in the archive."""
+        return list(self._prefixes)
+
+    def _prefix(self, dataset, mode):
+        if (dataset, mode) in self._prefixes:
+            return self._prefixes[(dataset, mode)]
+        matches = [p for (d, m), p in self._prefixes.items() if m == mode and d.rpartition('/')[2] == dataset]
+        if len(matches) != 1:
+            raise KeyError(f"condition not found or ambiguous: {dataset}/{mode}")
+        return matches[0]
+
+    def array(self, dataset, mode, name):
+        """Load a single array of a condition."""
+        return self._npz[f"{self._prefix(dataset, mode)}/{name}"]
+
+    def latencies(self, dataset, mode, metric, include_failed=False):
+        """
+        Latencies in ms for ``metric`` ('coldstart' or 'hmr'), in run order.
+        Failed and missing runs are dropped unless ``include_failed`` (then NaN).
+        """
+        values = self.array(dataset, mode, f'{metric}_ms')
+        return values if include_failed else values[~np.isnan(values)]
+
+    def failed(self, dataset, mode, metric):
+        """Boolean failure flag per run."""
+        return self.array(dataset, mode, f'{metric}_failed')
+
+    def telemetry(self, dataset, mode, run):
+        """(timestamp, cpu_percent, memory_mb) arrays for one run."""
+        runs = self.array(dataset, mode, 'run')
+        i = int(np.searchsorted(runs, run))
+        if i == len(runs) or runs[i] != run:
+            raise KeyError(f"run {run} not in {dataset}/{mode}")
+        offsets = self.array(dataset, mode, 'telemetry_offsets')
+        window = slice(offsets[i], offsets[i + 1])
+        return tuple(self.array(dataset, mode, name)[window] for name in ('timestamp', 'cpu_percent', 'memory_mb'))
+
+    def read_file(self, relpath):
+        """Bytes of a non-run file stored verbatim (e.g. 'SUMMARY.txt')."""
+        return self._npz.zip.read(FILES_PREFIX + relpath)
+
+    def read_environment(self):
+        """Text of the archived bundle's top-level environment.txt ('' if absent)."""
+        names = sorted((f for f in self.manifest['files'] if f.rpartition('/')[2] == 'environment.txt'),
+                       key=lambda f: f.count('/'))
+        return self.read_file(names[0]).decode('utf-8') if names else ''
+
+    def iter_run_files(self, dataset, mode):
+        """Yield (relative_path, bytes) for every original run file of a condition."""
+        prefix = self._prefix(dataset, mode)
+        directory = next(d for (d, m), p in self._prefixes.items() if p == prefix)
+        runs = self.array(dataset, mode, 'run')
+        present = {kind: self.array(dataset, mode, f'{kind}_present') for kind in (*LOG_KINDS, 'system')}
+        logs = {kind: (self.array(dataset, mode, f'{kind}_log'), self.array(dataset, mode, f'{kind}_log_offsets'))
+                for kind in LOG_KINDS}
+        offsets = self.array(dataset, mode, 'telemetry_offsets')
+        columns = [self.array(dataset, mode, name) for name in ('timestamp', 'cpu_percent', 'memory_mb')]
+        raw, raw_offsets = self.array(dataset, mode, 'system_raw'), self.array(dataset, mode, 'system_raw_offsets')
+        raw_mask = self.array(dataset, mode, 'system_raw_mask')
+
+        for i, run in enumerate(runs.tolist()):
+            for kind in LOG_KINDS:
+                if present[kind][i]:
+                    blob, blob_offsets = logs[kind]
+                    data = blob[blob_offsets[i]:blob_offsets[i + 1]].tobytes()
+                    yield _join(directory, run_file_name(mode, run, kind)), data
+            if present['system'][i]:
+                if raw_mask[i]:
+                    data = raw[raw_offsets[i]:raw_offsets[i + 1]].tobytes()
+                else:
+                    window = slice(offsets[i], offsets[i + 1])
+                    data = render_telemetry(*(c[window].tolist() for c in columns))
+                yield _join(directory, run_file_name(mode, run, 'system')), data
+
+def _join(directory, name):
+    return f"{directory}/{name}" if directory else name
+
+# =============================================================================
+# Main Execution
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pack or unpack a compact benchmark results archive.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('pack', help='Pack a results directory or zip into an archive')
+    p.add_argument('source')
+    p.add_argument('archive')
+    u = sub.add_parser('unpack', help='Restore the directory layout from an archive')
+    u.add_argument('archive')
+    u.add_argument('destination')
+    args = parser.parse_args(argv)
+
+    if args.command == 'pack':
+        if not os.path.exists(args.source):
+            parser.error(f"source not found: {args.source}")
+        try:
+            manifest = pack(args.source, args.archive)
+        except ValueError as e:
+            parser.error(str(e))
+        runs = sum(c['runs'] for c in manifest['conditions'])
+        print(f"📦 Packed {runs} runs in {len(manifest['conditions'])} conditions "
+              f"(+{len(manifest['files'])} files) -> {args.archive} "
+              f"({os.path.getsize(args.archive) / 1024:.1f} KB)")
+    else:
+        unpack(args.archive, args.destination)
+        print(f"📂 Unpacked {args.archive} -> {os.path.abspath(args.destination)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
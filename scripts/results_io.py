@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Next.js Toolchain Benchmark - Result Bundle Reader
+==================================================
+
+Shared parsing helpers for raw benchmark output. A *bundle* is either a
+directory or a ``.zip`` file (e.g. ``release_artifact.zip``) holding an
+``environment.txt`` and one or more dataset directories of run files:
+
+    <dataset>/{legacy,turbo}_run{N}_coldstart.log
+    <dataset>/{legacy,turbo}_run{N}_hmr.log
+    <dataset>/{legacy,turbo}_run{N}_system.csv
+
+Files are yielded one at a time so callers never hold more than a single
+run file in memory.
+
+Author: Benchmark Automation Suite
+Date: January 2026
+"""
+
+import csv
+import hashlib
+import io
+import os
+import re
+import zipfile
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RUN_FILE_RE = re.compile(r'^(legacy|turbo)_run(\d+)_(coldstart|hmr|system)\.(?:log|csv)$')
+
+# Regexes match the lines printed by measure_start.js / measure_hot_reload.js
+LATENCY_PATTERNS = {
+    'coldstart': re.compile(r'Ready detected: (\d+) ms'),
+    'hmr': re.compile(r'HMR Detected: (\d+) ms'),
+}
+
+# environment.txt keys accepted for each fingerprint field (first match wins).
+# run_benchmark.sh writes "MacOS"/"Chip" on Darwin and "OS"/"CPU" on Linux.
+ENVIRONMENT_KEYS = {
+    'cpu': ('CPU', 'Chip'),
+    'memory': ('Memory', 'RAM'),
+    'os': ('OS', 'MacOS'),
+    'node': ('NodeJS', 'Node'),
+    'nextjs': ('Next.js',),
+}
+
+FINGERPRINT_FIELDS = tuple(ENVIRONMENT_KEYS)
+
+MACOS_VERSION_RE = re.compile(r'\d+(?:\.\d+)*')
+
+SKIP_DIRS = {'node_modules', '.next', '.git'}
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+def run_file_name(mode, run, kind):
+    """File name used by run_benchmark.sh for a run file."""
+    ext = 'csv' if kind == 'system' else 'log'
+    return f"{mode}_run{run}_{kind}.{ext}"
+
+def match_run_file(name):
+    """
+    Return (mode, run, kind) if ``name`` is exactly a run file name as
+    written by run_benchmark.sh, else None. Names like ``legacy_run01_hmr.log``
+    or ``legacy_run1_hmr.csv`` are not run files.
+    """
+    match = RUN_FILE_RE.match(name)
+    if not match:
+        return None
+    mode, run, kind = match.group(1), int(match.group(2)), match.group(3)
+    return (mode, run, kind) if name == run_file_name(mode, run, kind) else None
+
+def parse_environment(text):
+    """Parse an environment.txt into a fingerprint dict (missing fields -> 'unknown')."""
+    entries = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(':')
+        if sep:
+            entries[key.strip()] = ' '.join(value.split())
+
+    fingerprint = {}
+    for field, keys in ENVIRONMENT_KEYS.items():
+        value = next((entries[k] for k in keys if entries.get(k)), 'unknown')
+        if field == 'os' and 'OS' not in entries and 'MacOS' in entries:
+            # Older environment.txt files carry the release name ("Sequoia 15.6"),
+            # run_benchmark.sh writes only the version ("15.6"); keep the version
+            version = MACOS_VERSION_RE.search(value)
+            value = f"macOS {version.group(0) if version else value}"
+        fingerprint[field] = value
+    return fingerprint
+
+def fingerprint_id(fingerprint):
+    """Stable short identifier for a fingerprint dict."""
+    canonical = '|'.join(fingerprint[f] for f in FINGERPRINT_FIELDS)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:12]
+
+def hardware_class(fingerprint):
+    """Hardware class label: CPU model plus installed memory."""
+    return f"{fingerprint['cpu']} / {fingerprint['memory']}"
+
+def parse_latency(text, kind):
+    """Return the latency in ms reported by a coldstart/hmr log, or None if the run failed."""
+    match = LATENCY_PATTERNS[kind].search(text)
+    return int(match.group(1)) if match else None
+
+def summarize_telemetry(text):
+    """Reduce a *_system.csv to (samples, peak_cpu_percent, peak_memory_mb, mean_cpu_percent)."""
+    samples = 0
+    peak_cpu = peak_mem = cpu_total = 0.0
+    for row in csv.DictReader(io.StringIO(text)):
+        try:
+            cpu = float(row['cpu_percent'])
+            mem = float(row['memory_mb'])
+        except (TypeError, ValueError):
+            continue
+        samples += 1
+        cpu_total += cpu
+        peak_cpu = max(peak_cpu, cpu)
+        peak_mem = max(peak_mem, mem)
+    mean_cpu = cpu_total / samples if samples else float('nan')
+    return samples, peak_cpu, peak_mem, mean_cpu
+
+# =============================================================================
+# Bundle Traversal
+# =============================================================================
+
+def iter_bundle_files(bundle):
+    """
+    Yield (relative_path, read) for every file in a bundle directory or zip,
+    where ``read()`` returns the file's bytes. Paths always use '/'.
+    Directories are walked lazily; all files of a directory are yielded
+    consecutively (zip members are grouped by directory first).
+    """
+    if zipfile.is_zipfile(bundle):
+        with zipfile.ZipFile(bundle) as zf:
+            infos = sorted(zf.infolist(), key=lambda info: info.filename.rpartition('/')[0])
+            for info in infos:
+                if info.is_dir():
+                    continue
+                yield info.filename, lambda name=info.filename: zf.read(name)
+        return
+
+    for root, dirs, files in os.walk(bundle):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            relpath = os.path.relpath(path, bundle).replace(os.sep, '/')
+            yield relpath, lambda path=path: _read_bytes(path)
+
+def iter_run_files(bundle):
+    """
+    Yield (dataset, mode, run, kind, read) for each run file in a bundle,
+    where ``read()`` returns the file's text. ``dataset`` is the path of
+    the directory holding the file relative to the bundle root (e.g.
+    ``results/final_dataset_n30``), so same-named directories under
+    different parents stay distinct.
+    """
+    for relpath, read in iter_bundle_files(bundle):
+        dataset, _, name = relpath.rpartition('/')
+        match = match_run_file(name)
+        if not match:
+            continue
+        mode, run, kind = match
+        yield dataset, mode, run, kind, lambda read=read: read().decode('utf-8')
+
+def read_environment(bundle):
+    """
+    Return the text of a bundle's shallowest environment.txt ('' if absent).
+    Directory and zip bundles use the same rule; ties at the same depth go
+    to the first file in traversal order.
+    """
+    best_depth, text = None, ''
+    for relpath, read in iter_bundle_files(bundle):
+        depth = relpath.count('/')
+        if relpath.rpartition('/')[2] == 'environment.txt' and (best_depth is None or depth < best_depth):
+            best_depth, text = depth, read().decode('utf-8')
+    return text
+
+def _read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
@@ -9,7 +9,19 @@ mkdir -p results/raw
 
 # Simpan info environment
 echo "Date: $(date)" > environment.txt
-echo "Next.js: 14.2.35" >> environment.txt
+echo "Next.js: $(node -p "require('next/package.json').version" 2>/dev/null || echo unknown)" >> environment.txt
+echo "NodeJS: $(node -v | sed 's/^v//')" >> environment.txt
+
+# Fingerprint mesin (dibaca oleh merge_results.py)
+if [ "$(uname)" = "Darwin" ]; then
+    echo "MacOS: $(sw_vers -productVersion)" >> environment.txt
+    echo "Chip: $(sysctl -n machdep.cpu.brand_string)" >> environment.txt
+    echo "Memory: $(( $(sysctl -n hw.memsize) / 1073741824 )) GB" >> environment.txt
+else
+    echo "OS: $(. /etc/os-release && echo "$PRETTY_NAME")" >> environment.txt
+    echo "CPU: $(grep -m1 'model name' /proc/cpuinfo | cut -d: -f2 | sed 's/^ *//')" >> environment.txt
+    echo "Memory: $(( ($(awk '/MemTotal/ {print $2}' /proc/meminfo) + 524288) / 1048576 )) GB" >> environment.txt
+fi
 
 for MODE in "${MODES[@]}"; do
     echo "################################################"